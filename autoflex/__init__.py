@@ -6,37 +6,67 @@
 
     :copyright: Copyright 2023 by daquintero <dario a quintero at gmail dot com>
     :license: BSD, see LICENSE for details.
+
+    Importing ``autoflex`` is kept lightweight, as it happens in every Sphinx process that loads the extension.
+    The directives, styles and extractors are only imported when the extension is set up or when they are used.
 """
 
 from typing import Any, Dict
-import pathlib
+import importlib
 
 from .install import install_verification
-from autoflex.directives import AutoFlex
-from autoflex.styles.setup import copy_autoflex_styles_to_static
-from autoflex.extractors import determine_pydantic_version_from_base_model, get_field_infos
 
 __version__ = "0.0.1"
 __author__ = "Dario Quintero Dominguez"
 __email__ = "dario a quintero at gmail dot com"
 
+_LAZY_ATTRIBUTES = {
+    "AutoFlex": "autoflex.directives",
+    "determine_pydantic_version_from_base_model": "autoflex.extractors",
+    "get_field_infos": "autoflex.extractors",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public objects of ``autoflex`` on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def setup(app) -> Dict[str, Any]:
     """
     Configure the ``autoflex`` extension onto your project.
     """
-    print("Started loading `autoflex` extension.")
+    from autoflex.directives import AutoFlex
+    from autoflex.directives.autoflex import merge_autoflex_labels, purge_autoflex_labels
+    from autoflex.precompress import precompress_build_output
+    from autoflex.styles.setup import (
+        collect_title_characters,
+        merge_title_characters,
+        purge_title_characters,
+        register_autoflex_styles,
+    )
+
     # DIRECTIVES
     app.add_directive("autoflex", AutoFlex)
+    app.connect('env-purge-doc', purge_autoflex_labels)
+    app.connect('env-merge-info', merge_autoflex_labels)
+    app.add_config_value('autoflex_property_store', '', 'env')
     # load the icon node/role
     # app.add_node(icon_node, **_NODE_VISITORS)  # type: ignore
     # app.add_role("icon", Icon())
 
     # STYLES
-    app.connect('build-finished', copy_autoflex_styles_to_static)
-    app.add_css_file("css/autoflex.css")
+    app.add_config_value('autoflex_subset_fonts', False, 'html')
+    app.connect('doctree-read', collect_title_characters)
+    app.connect('env-purge-doc', purge_title_characters)
+    app.connect('env-merge-info', merge_title_characters)
+    app.connect('env-updated', register_autoflex_styles)
 
-    print("Finished loading `autoflex` extension.")
+    # PRECOMPRESSION
+    app.add_config_value('autoflex_precompress', False, 'html')
+    app.connect('build-finished', precompress_build_output)
 
     return {
         "version": __version__,
@@ -1,18 +1,121 @@
 """
 This file contains the structure of a ParameterTable.
+
+A parameter table is rendered as a static table, which is also the fallback for search engines and readers without
+javascript. In the ``virtual`` mode, the rows are also embedded as a compact JSON payload that ``autoflex.js`` renders
+client-side, only laying out the visible rows and providing instant filtering and sorting.
 """
-from autoflex.types import PropertyTypes
+import json
+
+import pydantic as pd
+from docutils import nodes
+
+from autoflex.descriptors import TableCell, descriptor_registry
+from autoflex.extractors import extract_property_list_from_model
+from autoflex.types import PhysicalProperty, PropertyTypes
+from autoflex.types.structures import PropertyCollectionTable
 
-def extract_class_to_parameter_table(physcial_parameter: PropertyTypes) -> ParameterTable:
+PARAMETER_TABLE_COLUMNS = ["Name", "Types", "Description", "Default", "Unit", "Math"]
+
+
+def extract_class_to_parameter_table(model: pd.BaseModel) -> PropertyCollectionTable:
     """
     This method converts from a given class or schema declaration into a container of data required for a ParameterTable
     in its intended implementation.
     """
+    return extract_property_list_from_model(model)
+
+
+def property_to_cells(property_item: PropertyTypes) -> list[TableCell]:
+    """
+    Convert a property into the cells of a parameter table row, ordered as ``PARAMETER_TABLE_COLUMNS``.
+
+    The unit and math cells are precomputed by the descriptor registry, once per distinct descriptor.
+    """
+    unit = TableCell("")
+    math = TableCell("")
+    if isinstance(property_item, PhysicalProperty):
+        unit = descriptor_registry.unit_cell(property_item.unit)
+        math = descriptor_registry.symbolic_cell(property_item.math)
+
+    return [
+        TableCell(property_item.name),
+        TableCell(property_item.types),
+        TableCell(property_item.description),
+        TableCell(property_item.default),
+        unit,
+        math,
+    ]
+
 
-def parameter_table_to_nodes() -> list:
+def parameter_table_to_payload(table: PropertyCollectionTable) -> str:
+    """
+    Serialize a parameter table into the compact JSON payload rendered by ``autoflex.js``.
+
+    Cells typeset as math are wrapped in a single element list, e.g. ``["F = ma"]``, so that ``autoflex.js`` only
+    hands those to MathJax. The payload is embedded within a ``<script>`` element, so ``<``, ``>`` and ``&`` are escaped
+    as JSON unicode escapes, which the HTML parser cannot mistake for a closing tag or a comment.
+    """
+    payload = {
+        "columns": PARAMETER_TABLE_COLUMNS,
+        "rows": [
+            [[text] if math and text else text for text, math in property_to_cells(property_item)]
+            for property_item in table
+        ],
+    }
+    return (
+        json.dumps(payload, separators=(",", ":"))
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+    )
+
+
+def _row_to_entries(row: list[TableCell], literal_columns: tuple[int, ...] = ()) -> nodes.row:
+    row_node = nodes.row()
+    for index, (text, math) in enumerate(row):
+        entry = nodes.entry()
+        if text and index in literal_columns:
+            entry += nodes.paragraph("", "", nodes.literal(text, text))
+        elif text and math:
+            entry += nodes.paragraph("", "", nodes.math(text, text))
+        else:
+            entry += nodes.paragraph(text=text)
+        row_node += entry
+    return row_node
+
+
+def parameter_table_to_nodes(table: PropertyCollectionTable, virtual: bool = False) -> list:
     """
     This function converts the data container within a parameter table to sphinx nodes which can be used within both
     a given directive as the automated construction of a class based on an internal function.
 
     Should be a list of nodes that convert to sphinx.
     """
+    table_node = nodes.table(classes=["autoflex-parameter-table"])
+    group = nodes.tgroup(cols=len(PARAMETER_TABLE_COLUMNS))
+    table_node += group
+    for _ in PARAMETER_TABLE_COLUMNS:
+        group += nodes.colspec(colwidth=1)
+
+    header = nodes.thead()
+    header += _row_to_entries([TableCell(column) for column in PARAMETER_TABLE_COLUMNS])
+    group += header
+
+    body = nodes.tbody()
+    name_column = PARAMETER_TABLE_COLUMNS.index("Name")
+    for property_item in table:
+        body += _row_to_entries(property_to_cells(property_item), (name_column,))
+    group += body
+
+    if not virtual:
+        return [table_node]
+
+    container = nodes.container(classes=["autoflex-virtual-table"])
+    container += nodes.raw(
+        "",
+        f'<script type="application/json" class="autoflex-rows">{parameter_table_to_payload(table)}</script>',
+        format="html",
+    )
+    container += table_node
+    return [container]
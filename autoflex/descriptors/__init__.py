@@ -0,0 +1 @@
+from autoflex.descriptors.registry import DescriptorRegistry, TableCell, descriptor_registry
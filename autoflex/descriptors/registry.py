@@ -0,0 +1,106 @@
+"""
+This file contains the registry in which the ``Unit`` and ``Symbolic`` descriptors are interned.
+
+The same units and symbols are declared on many fields of many classes. The registry parses each declaration once,
+and returns the same immutable instance every time it is declared again, so that all the properties refer to shared
+instances. The table cell of each descriptor is also computed once and reused by every table it appears in.
+"""
+from typing import NamedTuple
+
+from autoflex.types.descriptors import Symbolic, SymbolicTypes, Unit, UnitTypes
+
+
+class TableCell(NamedTuple):
+    """The text of a parameter table cell, and whether it is typeset as math."""
+
+    text: str
+    math: bool = False
+
+
+def symbolic_to_cell(symbolic: Symbolic) -> TableCell:
+    """Convert a ``Symbolic`` into its table cell, typeset as math unless it is empty."""
+    return TableCell(symbolic.math, bool(symbolic.math))
+
+
+def unit_to_cell(unit: Unit) -> TableCell:
+    """Convert a ``Unit`` into its table cell, only typeset as math when its symbol is a ``Symbolic``."""
+    if isinstance(unit.symbol, Symbolic):
+        return symbolic_to_cell(unit.symbol)
+    return TableCell(unit.symbol)
+
+
+class DescriptorRegistry:
+    """
+    Interns the ``Unit`` and ``Symbolic`` descriptors, and their table cells.
+
+    Usage
+    -----
+
+    .. code::
+
+        unit = descriptor_registry.unit("um")
+        assert unit is descriptor_registry.unit("um")
+        descriptor_registry.unit_cell("um")
+    """
+
+    def __init__(self):
+        self._units: dict[UnitTypes, Unit] = {}
+        self._symbolics: dict[SymbolicTypes, Symbolic] = {}
+        self._unit_cells: dict[Unit, TableCell] = {}
+        self._symbolic_cells: dict[Symbolic, TableCell] = {}
+
+    def unit(self, unit: UnitTypes) -> Unit:
+        """Return the interned ``Unit`` of a unit string or ``Unit``."""
+        try:
+            return self._units[unit]
+        except KeyError:
+            pass
+
+        if isinstance(unit, Unit):
+            # Equal units declared separately resolve to the first declared instance
+            interned_unit = self._units.setdefault(unit, unit)
+        else:
+            parsed_unit = Unit(name=unit, symbol=unit)
+            interned_unit = self._units.setdefault(parsed_unit, parsed_unit)
+            self._units[unit] = interned_unit
+
+        self._unit_cells.setdefault(interned_unit, unit_to_cell(interned_unit))
+        return interned_unit
+
+    def symbolic(self, math: SymbolicTypes) -> Symbolic:
+        """Return the interned ``Symbolic`` of a math string or ``Symbolic``."""
+        try:
+            return self._symbolics[math]
+        except KeyError:
+            pass
+
+        if isinstance(math, Symbolic):
+            interned_symbolic = self._symbolics.setdefault(math, math)
+        else:
+            parsed_symbolic = Symbolic(label=math, math=math)
+            interned_symbolic = self._symbolics.setdefault(parsed_symbolic, parsed_symbolic)
+            self._symbolics[math] = interned_symbolic
+
+        self._symbolic_cells.setdefault(interned_symbolic, symbolic_to_cell(interned_symbolic))
+        return interned_symbolic
+
+    def unit_cell(self, unit: UnitTypes) -> TableCell:
+        """Return the precomputed table cell of a unit."""
+        return self._unit_cells[self.unit(unit)]
+
+    def symbolic_cell(self, math: SymbolicTypes) -> TableCell:
+        """Return the precomputed table cell of a symbolic."""
+        return self._symbolic_cells[self.symbolic(math)]
+
+    def clear(self):
+        """Remove all the interned descriptors."""
+        self._units.clear()
+        self._symbolics.clear()
+        self._unit_cells.clear()
+        self._symbolic_cells.clear()
+
+
+descriptor_registry = DescriptorRegistry()
+"""
+The registry shared by the extractors.
+"""
@@ -2,13 +2,52 @@ from typing import Any, List
 from docutils import nodes
 from docutils.parsers.rst import directives
 from sphinx.util.docutils import SphinxDirective
+from sphinx import addnodes
 from sphinx.util.logging import getLogger
-from pydantic import BaseModel
 import importlib
 import json
+import pathlib
 
 logger = getLogger(__name__)
 
+
+def class_label(cls: type) -> str:
+    """Return the cross-reference label of the ``autoflex`` section documenting a class."""
+    return f"autoflex-{cls.__module__}.{cls.__qualname__}".lower()
+
+
+def schema_property_key(field_info: Any, field_name: str) -> str:
+    """
+    Return the key of a field within the validation JSON schema of its model, as generated with ``by_alias=True``.
+    """
+    validation_alias = field_info.validation_alias
+    if isinstance(validation_alias, str):
+        return validation_alias
+    if validation_alias is not None and hasattr(validation_alias, 'choices'):
+        # The first choice that is a single string path is used as the key in the JSON schema
+        for choice in validation_alias.choices:
+            if isinstance(choice, str):
+                return choice
+            path = choice.convert_to_aliases()
+            if len(path) == 1 and isinstance(path[0], str):
+                return path[0]
+    return field_name
+
+
+def purge_autoflex_labels(app, env, docname):
+    if hasattr(env, 'autoflex_labels'):
+        for label in [label for label, label_docname in env.autoflex_labels.items() if label_docname == docname]:
+            del env.autoflex_labels[label]
+
+
+def merge_autoflex_labels(app, env, docnames, other):
+    if hasattr(other, 'autoflex_labels'):
+        if not hasattr(env, 'autoflex_labels'):
+            env.autoflex_labels = {}
+        for label, docname in other.autoflex_labels.items():
+            env.autoflex_labels.setdefault(label, docname)
+
+
 class AutoFlex(SphinxDirective):
     """
     Extension of the ``.. autoflex::`` directive.
@@ -35,6 +74,17 @@ class AutoFlex(SphinxDirective):
         .. autoflex:: my_package.BasicClass
             :title: BasicClass Schema
             :description: This schema represents the basic structure of the BasicClass.
+            :inherited: link
+            :table: virtual
+
+    The ``inherited`` option controls how fields declared on base classes are rendered. With ``all``, the default,
+    the full field set is rendered. With ``link``, only the fields the class introduces or overrides are rendered,
+    and the inherited fields are listed in a collapsible reference back to each base class section.
+
+    The ``table`` option renders the properties of the class in a parameter table. With ``static``, a standard table
+    is rendered. With ``virtual``, intended for classes with hundreds of fields, the rows are also embedded as a compact
+    payload which ``autoflex.js`` renders client-side, laying out only the visible rows with instant filtering and
+    sorting. The static table remains in the page as the fallback without javascript.
     """
 
     has_content = False
@@ -44,9 +94,15 @@ class AutoFlex(SphinxDirective):
     option_spec = {
         'title': directives.unchanged,
         'description': directives.unchanged,
+        'inherited': lambda argument: directives.choice(argument, ('all', 'link')),
+        'table': lambda argument: directives.choice(argument, ('static', 'virtual')),
     }
 
     def run(self) -> List[nodes.Node]:
+        # Imported on first use so that registering the extension does not import pydantic
+        from pydantic import BaseModel
+        from autoflex.extractors import get_field_names_by_defining_class
+
         import_path = self.arguments[0]
         logger.debug(f"AutoFlex processing import path: {import_path}")
 
@@ -76,6 +132,19 @@ class AutoFlex(SphinxDirective):
             )
             return [error]
 
+        # Persist the extracted properties if the property store is enabled, reusing the schema for the content hash
+        properties = None
+        if self.config.autoflex_property_store:
+            import sqlite3
+
+            from autoflex.store import get_or_extract_properties, get_property_store
+
+            store_path = pathlib.Path(self.env.srcdir) / self.config.autoflex_property_store
+            try:
+                properties = get_or_extract_properties(get_property_store(store_path), cls, schema_dict)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"AutoFlex could not store the properties of {import_path}: {e}")
+
         # Generate documentation nodes from the schema
         nodes_list = []
 
@@ -83,6 +152,15 @@ class AutoFlex(SphinxDirective):
         section_id = f'autoflex-{class_name.lower()}'
         section_node = nodes.section(ids=[section_id])
 
+        # Only the first section documenting a class is registered as the target of the inherited field links
+        if not hasattr(self.env, 'autoflex_labels'):
+            self.env.autoflex_labels = {}
+        label = class_label(cls)
+        if label not in self.env.autoflex_labels:
+            self.env.autoflex_labels[label] = self.env.docname
+            section_node['names'].append(label)
+            self.state.document.note_explicit_target(section_node)
+
         # Title
         title_text = self.options.get('title', f"Schema for `{class_name}`")
         title_node = nodes.title(text=title_text)
@@ -94,6 +172,28 @@ class AutoFlex(SphinxDirective):
             description_node = nodes.paragraph(text=description)
             section_node += description_node
 
+        # Only render the fields introduced or overridden by this class, and link the inherited ones
+        own_field_names = None
+        if self.options.get('inherited', 'all') == 'link':
+            field_names_by_class = get_field_names_by_defining_class(cls)
+            own_field_names = field_names_by_class.pop(cls, [])
+            schema_dict = self._filter_schema_properties(cls, schema_dict, own_field_names)
+            if field_names_by_class:
+                section_node.extend(self._inherited_field_nodes(field_names_by_class))
+
+        # Parameter table of the properties
+        if 'table' in self.options:
+            from autoflex.constructors.parameter_table import (
+                extract_class_to_parameter_table,
+                parameter_table_to_nodes,
+            )
+
+            if properties is None:
+                properties = extract_class_to_parameter_table(cls)
+            if own_field_names is not None:
+                properties = [property_item for property_item in properties if property_item.name in own_field_names]
+            section_node.extend(parameter_table_to_nodes(properties, virtual=self.options['table'] == 'virtual'))
+
         # JSON Schema as a literal block
         try:
             schema_json = json.dumps(schema_dict, indent=2)
@@ -113,3 +213,49 @@ class AutoFlex(SphinxDirective):
         nodes_list.append(section_node)
 
         return nodes_list
+
+    @staticmethod
+    def _filter_schema_properties(cls: type, schema_dict: dict, field_names: List[str]) -> dict:
+        """Return a copy of the schema which only contains the properties of the given fields."""
+        property_keys = {schema_property_key(cls.model_fields[name], name) for name in field_names}
+        filtered_schema_dict = dict(schema_dict)
+        filtered_schema_dict['properties'] = {
+            key: value for key, value in schema_dict.get('properties', {}).items() if key in property_keys
+        }
+        if 'required' in schema_dict:
+            filtered_schema_dict['required'] = [key for key in schema_dict['required'] if key in property_keys]
+        return filtered_schema_dict
+
+    @staticmethod
+    def _inherited_field_nodes(field_names_by_class: dict[type, List[str]]) -> List[nodes.Node]:
+        """Construct a collapsible reference from the inherited fields to each base class section."""
+        field_count = sum(len(field_names) for field_names in field_names_by_class.values())
+        inherited_nodes = [
+            nodes.raw(
+                '',
+                f'<details class="autoflex-inherited"><summary>Inherited fields ({field_count})</summary>',
+                format='html',
+            )
+        ]
+
+        for base, field_names in field_names_by_class.items():
+            paragraph = nodes.paragraph()
+            reference = addnodes.pending_xref(
+                '',
+                refdomain='std',
+                reftype='ref',
+                reftarget=class_label(base),
+                refexplicit=True,
+            )
+            reference += nodes.literal(base.__name__, base.__name__)
+            paragraph += nodes.Text('From ')
+            paragraph += reference
+            paragraph += nodes.Text(': ')
+            for index, field_name in enumerate(field_names):
+                if index:
+                    paragraph += nodes.Text(', ')
+                paragraph += nodes.literal(field_name, field_name)
+            inherited_nodes.append(paragraph)
+
+        inherited_nodes.append(nodes.raw('', '</details>', format='html'))
+        return inherited_nodes
@@ -9,7 +9,9 @@ Note that the compilation flow is as follows:
 
 Then, this automated flow can be run for a given BaseModel and the properties can be extracted accordingly.
 """
+import inspect
 import pydantic as pd
+from autoflex.descriptors import descriptor_registry
 from autoflex.types import PropertyTypes, FieldTypes, PhysicalProperty, PhysicalFieldInfo, Property
 from autoflex.version_manager import determine_pydantic_version_from_base_model
 
@@ -32,6 +34,58 @@ def get_field_infos(model: pd.BaseModel):
     return field_infos
 
 
+def get_field_names_by_defining_class(model: pd.BaseModel) -> dict[type, list[str]]:
+    """
+    Group the field names of a Pydantic model by the class in its hierarchy that introduces or overrides them.
+
+    Args:
+        model: The Pydantic BaseModel class or instance.
+
+    Returns:
+        dict[type, list[str]]: The field names keyed by defining class, in method resolution order.
+    """
+    model_class = model if isinstance(model, type) else type(model)
+    version = determine_pydantic_version_from_base_model(model_class)
+    if version == 2:
+        field_names = list(model_class.model_fields.keys())
+    else:
+        field_names = list(model_class.__fields__.keys())
+
+    remaining_field_names = set(field_names)
+    field_names_by_class = {}
+    for base in model_class.__mro__:
+        annotations = inspect.get_annotations(base)
+        base_field_names = [name for name in field_names if name in remaining_field_names and name in annotations]
+        if base_field_names:
+            field_names_by_class[base] = base_field_names
+            remaining_field_names.difference_update(base_field_names)
+
+    # Fields without a declaring annotation anywhere, e.g. from `create_model`, belong to the model itself.
+    if remaining_field_names:
+        field_names_by_class.setdefault(model_class, []).extend(
+            name for name in field_names if name in remaining_field_names
+        )
+
+    return field_names_by_class
+
+
+def field_type_to_string(field: FieldTypes) -> str:
+    """
+    Convert the declared type of a field into a readable string, e.g. ``float`` or ``Optional[list[int]]``.
+
+    The type is read from the ``annotation`` of Pydantic v2 field infos, or the ``outer_type_`` of Pydantic v1 fields.
+    Field infos created outside of a model have no type, and return an empty string.
+    """
+    annotation = getattr(field, "annotation", None)
+    if annotation is None:
+        annotation = getattr(field, "outer_type_", None)
+    if annotation is None:
+        return ""
+    if isinstance(annotation, type) and not getattr(annotation, "__args__", None):
+        return annotation.__qualname__
+    return str(annotation).replace("typing.", "")
+
+
 def physical_field_info_to_physical_property(field: PhysicalFieldInfo, field_name: str) -> PhysicalProperty:
     """
     Convert a PhysicalFieldInfo instance to a PhysicalProperty.
@@ -43,16 +97,15 @@ def physical_field_info_to_physical_property(field: PhysicalFieldInfo, field_nam
     Returns:
         PhysicalProperty: The corresponding PhysicalProperty instance.
     """
-    # Extract unit and math information
-    unit = field.unit
-    math = field.math
+    # Extract the shared unit and math instances
+    unit = descriptor_registry.unit(field.unit)
+    math = descriptor_registry.symbolic(field.math)
 
     # Extract other field attributes
     description = field.description or ""
     default = field.default if field.default is not None else ""
 
-    # Assuming 'types' can be inferred from the field's type
-    types = str(field.outer_type_) if hasattr(field, 'outer_type_') else ""
+    types = field_type_to_string(field)
 
     return PhysicalProperty(
         name=field_name,
@@ -77,7 +130,7 @@ def field_info_to_property(field: pd.fields.FieldInfo, field_name: str) -> Prope
     """
     description = field.description or ""
     default = field.default if field.default is not None else ""
-    types = str(field.outer_type_) if hasattr(field, 'outer_type_') else ""
+    types = field_type_to_string(field)
 
     return Property(
         name=field_name,
@@ -1,7 +1,93 @@
-from typing import Any, Optional
-from pydantic import Field
+import inspect
+from typing import Any
+from warnings import warn
+
+from pydantic import AliasChoices, AliasPath, Field, PydanticDeprecatedSince20, PydanticUserError
 from autoflex.types import PhysicalFieldInfo, UnitTypes, SymbolicTypes
 
+_FIELD_ARGUMENT_NAMES = set(inspect.signature(Field).parameters) - {"extra"}
+"""
+The keyword arguments accepted by pydantic's Field, any other keyword argument is a deprecated extra.
+"""
+
+_REMOVED_ARGUMENTS = {
+    "const": "`const` is removed, use `Literal` instead",
+    "unique_items": (
+        "`unique_items` is removed, use `Set` instead"
+        "(this feature is discussed in https://github.com/pydantic/pydantic-core/issues/296)"
+    ),
+    "regex": "`regex` is removed. use `pattern` instead",
+}
+
+_DEPRECATED_ARGUMENTS = {
+    "min_items": "min_length",
+    "max_items": "max_length",
+}
+
+
+def _normalize_field_kwargs(kwargs: dict) -> dict:
+    """
+    Apply the keyword argument handling of pydantic's Field, which FieldInfo does not perform itself.
+
+    The checks are made in the same order as pydantic's Field, as the handling of ``include`` depends on it.
+    """
+    for name, message in _REMOVED_ARGUMENTS.items():
+        if kwargs.pop(name, None) is not None:
+            raise PydanticUserError(message, code="removed-kwargs")
+
+    for name, replacement in _DEPRECATED_ARGUMENTS.items():
+        value = kwargs.pop(name, None)
+        if value is not None:
+            warn(
+                f"`{name}` is deprecated and will be removed, use `{replacement}` instead",
+                PydanticDeprecatedSince20,
+                stacklevel=3,
+            )
+            if kwargs.get(replacement) is None:
+                kwargs[replacement] = value
+
+    allow_mutation = kwargs.pop("allow_mutation", None)
+    if allow_mutation is not None:
+        warn(
+            "`allow_mutation` is deprecated and will be removed. use `frozen` instead",
+            PydanticDeprecatedSince20,
+            stacklevel=3,
+        )
+        if allow_mutation is False:
+            kwargs["frozen"] = True
+
+    extra = {name: kwargs.pop(name) for name in list(kwargs) if name not in _FIELD_ARGUMENT_NAMES}
+    if extra:
+        warn(
+            "Using extra keyword arguments on `Field` is deprecated and will be removed."
+            " Use `json_schema_extra` instead."
+            f" (Extra keys: {', '.join(repr(name) for name in extra)})",
+            PydanticDeprecatedSince20,
+            stacklevel=3,
+        )
+        if not kwargs.get("json_schema_extra"):
+            kwargs["json_schema_extra"] = extra
+
+    validation_alias = kwargs.get("validation_alias")
+    if validation_alias and not isinstance(validation_alias, (str, AliasChoices, AliasPath)):
+        raise TypeError("Invalid `validation_alias` type. it should be `str`, `AliasChoices`, or `AliasPath`")
+
+    alias = kwargs.get("alias")
+    if isinstance(alias, str) and kwargs.get("serialization_alias") is None:
+        kwargs["serialization_alias"] = alias
+    if alias is not None and kwargs.get("validation_alias") is None:
+        kwargs["validation_alias"] = alias
+
+    # As in pydantic's Field, `include` is also an extra and is only removed from it once it was used as the schema extra
+    if extra.pop("include", None) is not None:
+        warn(
+            "`include` is deprecated and does nothing. It will be removed, use `exclude` instead",
+            PydanticDeprecatedSince20,
+            stacklevel=3,
+        )
+
+    return kwargs
+
 
 def PhysicalField(
     default: Any = ...,
@@ -11,9 +97,13 @@ def PhysicalField(
     **kwargs
 ) -> PhysicalFieldInfo:
     """
-    A wrapper around pydantic's Field function that returns an instance of AutoflexFieldInfo
+    A wrapper around pydantic's Field function that returns an instance of PhysicalFieldInfo
     instead of FieldInfo.
 
+    The field info is constructed once and keeps all the keyword arguments, handled as in pydantic's Field. The
+    ``unit`` and ``math`` are stored as declared, so no ``Unit`` or ``Symbolic`` is built until the documentation
+    is extracted.
+
     Args:
         default: The default value of the field.
         unit: The UnitType to represent.
@@ -21,15 +111,11 @@ def PhysicalField(
         **kwargs: Any other keyword arguments passed to pydantic's Field.
 
     Returns:
-        AutoflexFieldInfo: Custom field info object.
+        PhysicalFieldInfo: Custom field info object.
     """
-
-    # Need to compile this into a FieldInfo in order to extract the correct kwargs.
-    field_info = Field(default=default, **kwargs)
-
-    # Return an instance of AutoflexFieldInfo instead of the default FieldInfo
     return PhysicalFieldInfo(
         default=default,
         unit=unit,
         math=math,
+        **_normalize_field_kwargs(kwargs)
     )
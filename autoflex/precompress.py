@@ -0,0 +1,96 @@
+"""
+This file contains the opt-in precompression of the generated documentation pages.
+
+When ``autoflex_precompress`` is enabled, a ``.gz`` copy of every HTML page and JSON file in the build output is
+written at the end of the build, so static hosting can serve them without compressing on every request. The content
+hash of each compressed file is recorded in a manifest in the doctree directory, so that it is not deployed with the
+site, and only files that changed since the last build are compressed again.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import hashlib
+import json
+import os
+import pathlib
+
+from sphinx.util.logging import getLogger
+
+logger = getLogger(__name__)
+
+PRECOMPRESS_SUFFIXES = (".html", ".json")
+PRECOMPRESS_MANIFEST_NAME = "autoflex_precompress.json"
+PRECOMPRESS_POOL_MIN_FILES = 16
+"""
+The minimum number of files to compress for a process pool to be started in a parallel build.
+"""
+
+
+def compress_file(path: str) -> None:
+    """
+    Write the gzip compressed copy of a file next to it. The gzip timestamp is fixed so the output is reproducible.
+    """
+    source_path = pathlib.Path(path)
+    compressed_path = source_path.with_name(f"{source_path.name}.gz")
+    compressed_path.write_bytes(gzip.compress(source_path.read_bytes(), compresslevel=9, mtime=0))
+
+
+def iter_build_output_files(outdir: pathlib.Path, doctreedir: pathlib.Path):
+    """
+    Yield the files of the build output to precompress, skipping the doctree directory and hidden directories.
+
+    The doctree directory is within the output with the plain ``sphinx-build src out`` layout, as ``out/.doctrees``.
+    """
+    doctreedir = doctreedir.resolve()
+    for directory, directory_names, file_names in os.walk(outdir):
+        directory_names[:] = sorted(
+            name
+            for name in directory_names
+            if not name.startswith(".") and (pathlib.Path(directory) / name).resolve() != doctreedir
+        )
+        for file_name in sorted(file_names):
+            path = pathlib.Path(directory) / file_name
+            if path.suffix in PRECOMPRESS_SUFFIXES:
+                yield path
+
+
+def precompress_build_output(app, exception):
+    """
+    Compress the HTML pages and JSON files of the build output which changed since the last build.
+    """
+    if exception is not None or not app.config.autoflex_precompress or app.builder.format != "html":
+        return
+
+    outdir = pathlib.Path(app.outdir)
+    doctreedir = pathlib.Path(app.doctreedir)
+    manifest_path = doctreedir / PRECOMPRESS_MANIFEST_NAME
+    try:
+        previous_manifest = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        previous_manifest = {}
+
+    manifest = {}
+    outdated_paths = []
+    for path in iter_build_output_files(outdir, doctreedir):
+        relative_path = path.relative_to(outdir).as_posix()
+        manifest[relative_path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        if (
+            previous_manifest.get(relative_path) != manifest[relative_path]
+            or not path.with_name(f"{path.name}.gz").exists()
+        ):
+            outdated_paths.append(str(path))
+
+    # Remove the compressed copies of files which are no longer in the build output
+    for relative_path in previous_manifest.keys() - manifest.keys():
+        (outdir / f"{relative_path}.gz").unlink(missing_ok=True)
+
+    # Serial builds, and parallel builds with only a few changed files, are compressed in process
+    if app.parallel > 1 and len(outdated_paths) >= PRECOMPRESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=app.parallel) as executor:
+            list(executor.map(compress_file, outdated_paths, chunksize=16))
+    else:
+        for path in outdated_paths:
+            compress_file(path)
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    logger.info(f"autoflex precompressed {len(outdated_paths)} of {len(manifest)} files.")
@@ -0,0 +1,194 @@
+"""
+This file contains the optional on-disk store of the extracted properties.
+
+The properties extracted from each class are persisted in a SQLite database, keyed by the import path of the class and
+a content hash of its schema and fields, so that they survive between builds and can be queried from scripts. The database is
+opened in write-ahead-log mode, so the parallel Sphinx workers can read it concurrently whilst another one writes.
+
+Usage
+-----
+
+.. code::
+
+    from autoflex.store import PropertyStore
+
+    store = PropertyStore("_build/autoflex_properties.sqlite")
+    store.find_properties(unit="um")
+"""
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+
+import autoflex
+from autoflex.descriptors import descriptor_registry
+from autoflex.extractors import extract_property_list_from_model
+from autoflex.types import PhysicalProperty, Property, PropertyTypes, Symbolic
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classes (
+    class_path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS properties (
+    class_path TEXT NOT NULL REFERENCES classes (class_path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    unit TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (class_path, position)
+);
+CREATE INDEX IF NOT EXISTS properties_name ON properties (name);
+CREATE INDEX IF NOT EXISTS properties_unit ON properties (unit);
+"""
+
+_PROPERTY_STORES: dict[tuple[int, str], "PropertyStore"] = {}
+
+
+def class_path(model: type) -> str:
+    """Return the import path of a class, as used in the ``.. autoflex::`` directive."""
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def model_content_hash(model: type, schema: dict | None = None) -> str:
+    """
+    Hash everything the extracted properties of a Pydantic model depend on.
+
+    The JSON schema and the field infos are the resolved state of the class, so they also change with the constants and
+    the types it references from other modules. The ``autoflex`` version is included as the extraction itself changes
+    between releases.
+
+    Args:
+        model: The Pydantic model class.
+        schema: The JSON schema of the model, if already generated. It is generated from the model otherwise.
+    """
+    if schema is None:
+        schema = model.model_json_schema()
+
+    content_hash = hashlib.sha256()
+    content_hash.update(autoflex.__version__.encode())
+    content_hash.update(json.dumps(schema, sort_keys=True, default=repr).encode())
+    for field_name, field_info in model.model_fields.items():
+        content_hash.update(f"{field_name}={field_info!r}".encode())
+    return content_hash.hexdigest()
+
+
+def _unit_key(property_item: PropertyTypes) -> str | None:
+    """Return the unit symbol used to index a property, if it has a unit."""
+    if not isinstance(property_item, PhysicalProperty):
+        return None
+    unit = descriptor_registry.unit(property_item.unit)
+    return unit.symbol.label if isinstance(unit.symbol, Symbolic) else unit.symbol
+
+
+def _load_property(data: str) -> PropertyTypes:
+    """Load a stored property, resolving its unit and math to the shared descriptor instances."""
+    fields = json.loads(data)
+    if "unit" not in fields:
+        return Property.model_validate(fields)
+
+    property_item = PhysicalProperty.model_validate(fields)
+    return property_item.model_copy(
+        update={
+            "unit": descriptor_registry.unit(property_item.unit),
+            "math": descriptor_registry.symbolic(property_item.math),
+        }
+    )
+
+
+class PropertyStore:
+    """
+    A SQLite-backed store of the properties extracted from each class.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(_SCHEMA)
+
+    def get_properties(self, model_path: str, content_hash: str | None = None) -> list[PropertyTypes] | None:
+        """
+        Return the stored properties of a class, or ``None`` if it is not stored or its content hash does not match.
+        """
+        row = self.connection.execute(
+            "SELECT content_hash FROM classes WHERE class_path = ?", (model_path,)
+        ).fetchone()
+        if row is None or (content_hash is not None and row[0] != content_hash):
+            return None
+
+        rows = self.connection.execute(
+            "SELECT data FROM properties WHERE class_path = ? ORDER BY position", (model_path,)
+        ).fetchall()
+        return [_load_property(data) for (data,) in rows]
+
+    def put_properties(self, model_path: str, content_hash: str, properties: list[PropertyTypes]):
+        """Replace the stored properties of a class."""
+        with self.connection:
+            self.connection.execute("DELETE FROM classes WHERE class_path = ?", (model_path,))
+            self.connection.execute(
+                "INSERT INTO classes (class_path, content_hash) VALUES (?, ?)", (model_path, content_hash)
+            )
+            self.connection.executemany(
+                "INSERT INTO properties (class_path, position, name, unit, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (model_path, position, property_item.name, _unit_key(property_item), property_item.model_dump_json())
+                    for position, property_item in enumerate(properties)
+                ],
+            )
+
+    def find_properties(
+        self,
+        model_path: str | None = None,
+        name: str | None = None,
+        unit: str | None = None,
+    ) -> list[tuple[str, PropertyTypes]]:
+        """
+        Query the stored properties by class import path, field name and unit symbol.
+
+        Returns:
+            list[tuple[str, PropertyTypes]]: The class import path and property of every matching row.
+        """
+        conditions = []
+        parameters = []
+        for column, value in (("class_path", model_path), ("name", name), ("unit", unit)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        rows = self.connection.execute(
+            f"SELECT class_path, data FROM properties {where} ORDER BY class_path, position", parameters
+        ).fetchall()
+        return [(row_class_path, _load_property(data)) for row_class_path, data in rows]
+
+    def close(self):
+        self.connection.close()
+
+
+def get_property_store(path: str | os.PathLike) -> PropertyStore:
+    """
+    Return the store at a path, opened once per process since SQLite connections cannot be shared across a fork.
+    """
+    key = (os.getpid(), str(pathlib.Path(path).resolve()))
+    if key not in _PROPERTY_STORES:
+        _PROPERTY_STORES[key] = PropertyStore(path)
+    return _PROPERTY_STORES[key]
+
+
+def get_or_extract_properties(store: PropertyStore, model: type, schema: dict | None = None) -> list[PropertyTypes]:
+    """
+    Return the stored properties of a model, extracting and storing them if its content changed.
+
+    The JSON schema of the model can be passed if it was already generated, as in the ``.. autoflex::`` directive.
+    """
+    model_path = class_path(model)
+    content_hash = model_content_hash(model, schema)
+    properties = store.get_properties(model_path, content_hash)
+    if properties is None:
+        properties = extract_property_list_from_model(model)
+        store.put_properties(model_path, content_hash, properties)
+    return properties
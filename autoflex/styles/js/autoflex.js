@@ -0,0 +1,166 @@
+/*
+ * Virtualized rendering of the autoflex parameter tables.
+ *
+ * Each `.autoflex-virtual-table` embeds its rows as a JSON payload next to a static table. When javascript runs, the
+ * static table is hidden and only the rows within the scrolled viewport are laid out, with instant filtering and
+ * sorting. Without javascript, the static table is shown as is.
+ *
+ * Math cells are wrapped in a single element list within the payload. The hidden static table is excluded from
+ * MathJax, and only the math of the rendered rows is typeset, once per row.
+ */
+(function () {
+  "use strict";
+
+  var ROW_HEIGHT = 32;
+  var VIEWPORT_ROWS = 20;
+  var OVERSCAN_ROWS = 5;
+
+  var typesetQueue = Promise.resolve();
+
+  function cellText(cell) {
+    return Array.isArray(cell) ? cell[0] : cell;
+  }
+
+  function compareCells(first, second) {
+    return cellText(first).localeCompare(cellText(second), undefined, { numeric: true, sensitivity: "base" });
+  }
+
+  function createRow(cells, className, tagName) {
+    var row = document.createElement("div");
+    row.className = className;
+    cells.forEach(function (cell) {
+      var element = document.createElement(tagName);
+      element.className = "autoflex-cell";
+      element.title = cellText(cell);
+      if (Array.isArray(cell)) {
+        // Marked up as the inline math written by Sphinx, which its MathJax configuration processes
+        var math = document.createElement("span");
+        math.className = "math notranslate nohighlight";
+        math.textContent = "\\(" + cell[0] + "\\)";
+        element.appendChild(math);
+      } else {
+        element.textContent = cell;
+      }
+      row.appendChild(element);
+    });
+    return row;
+  }
+
+  function typeset(elements) {
+    // MathJax is loaded asynchronously, the rows rendered before it loads are typeset with the rest of the page
+    var mathJax = window.MathJax;
+    if (!elements.length || !mathJax || !mathJax.typesetPromise) {
+      return;
+    }
+    typesetQueue = typesetQueue
+      .then(function () {
+        return mathJax.typesetPromise(elements);
+      })
+      .catch(function () {});
+  }
+
+  function setupVirtualTable(container) {
+    var payload = JSON.parse(container.querySelector("script.autoflex-rows").textContent);
+    var rows = payload.rows;
+    var visibleRows = rows;
+    var sortColumn = null;
+    var sortAscending = true;
+    var renderRequested = false;
+    var rowElements = new WeakMap();
+    var hasMath = rows.some(function (row) {
+      return row.some(Array.isArray);
+    });
+
+    var filter = document.createElement("input");
+    filter.type = "search";
+    filter.className = "autoflex-filter";
+    filter.placeholder = "Filter " + rows.length + " fields";
+    filter.setAttribute("aria-label", "Filter fields");
+
+    var header = createRow(payload.columns, "autoflex-row autoflex-header", "button");
+    Array.prototype.forEach.call(header.children, function (button, column) {
+      button.type = "button";
+      button.addEventListener("click", function () {
+        sortAscending = sortColumn === column ? !sortAscending : true;
+        sortColumn = column;
+        update();
+      });
+    });
+
+    var viewport = document.createElement("div");
+    viewport.className = "autoflex-viewport";
+    var spacer = document.createElement("div");
+    spacer.className = "autoflex-spacer";
+    var body = document.createElement("div");
+    body.className = "autoflex-body";
+    spacer.appendChild(body);
+    viewport.appendChild(spacer);
+
+    function render() {
+      renderRequested = false;
+      var first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+      var last = Math.min(visibleRows.length, first + VIEWPORT_ROWS + 2 * OVERSCAN_ROWS);
+      var fragment = document.createDocumentFragment();
+      var createdRows = [];
+      for (var index = first; index < last; index++) {
+        // Rows are kept once created, so their math is only typeset the first time they are rendered
+        var row = rowElements.get(visibleRows[index]);
+        if (!row) {
+          row = createRow(visibleRows[index], "autoflex-row", "div");
+          rowElements.set(visibleRows[index], row);
+          createdRows.push(row);
+        }
+        fragment.appendChild(row);
+      }
+      body.style.transform = "translateY(" + first * ROW_HEIGHT + "px)";
+      body.replaceChildren(fragment);
+      if (hasMath) {
+        typeset(createdRows);
+      }
+    }
+
+    function update() {
+      var query = filter.value.trim().toLowerCase();
+      visibleRows = rows.filter(function (row) {
+        return !query || row.map(cellText).join(" ").toLowerCase().indexOf(query) !== -1;
+      });
+      if (sortColumn !== null) {
+        visibleRows.sort(function (first, second) {
+          var order = compareCells(first[sortColumn], second[sortColumn]);
+          return sortAscending ? order : -order;
+        });
+      }
+      spacer.style.height = visibleRows.length * ROW_HEIGHT + "px";
+      viewport.style.height = Math.min(visibleRows.length, VIEWPORT_ROWS) * ROW_HEIGHT + "px";
+      viewport.scrollTop = 0;
+      render();
+    }
+
+    viewport.addEventListener("scroll", function () {
+      if (!renderRequested) {
+        renderRequested = true;
+        window.requestAnimationFrame(render);
+      }
+    });
+    filter.addEventListener("input", update);
+
+    container.style.setProperty("--autoflex-columns", payload.columns.length);
+    container.style.setProperty("--autoflex-row-height", ROW_HEIGHT + "px");
+    var table = container.querySelector("table");
+    table.hidden = true;
+    table.classList.add("tex2jax_ignore", "mathjax_ignore");
+    container.append(filter, header, viewport);
+    update();
+  }
+
+  function setupVirtualTables() {
+    document.querySelectorAll(".autoflex-virtual-table").forEach(setupVirtualTable);
+  }
+
+  // The deferred script normally runs before MathJax typesets the page, so the static tables are excluded in time
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", setupVirtualTables);
+  } else {
+    setupVirtualTables();
+  }
+})();
@@ -1,21 +1,216 @@
-import shutil
+"""
+This file contains the static asset pipeline of the ``autoflex`` styles.
+
+The stylesheet, its fonts and the table script are written into the ``_static`` build directory under content-hashed
+filenames, so they can be cached long-term by the docs hosting and only get written when their content changes. They
+are written before the pages, so the pages always link to assets which already exist. Optionally, the bundled fonts
+can be subset down to the characters used by the titles of the documentation, which requires ``fontTools`` (and
+``brotli`` for the ``.woff2`` font). The subset fonts are cached in the doctree directory by character set.
+"""
+import hashlib
+import importlib.util
+import io
 import pathlib
+import re
+import string
+
+from docutils import nodes
+from sphinx.util.logging import getLogger
+
+logger = getLogger(__name__)
+
+STYLES_DIRECTORY = pathlib.Path(__file__).parent / "css"
+STYLESHEET_NAME = "autoflex.css"
+SCRIPTS_DIRECTORY = pathlib.Path(__file__).parent / "js"
+SCRIPT_NAME = "autoflex.js"
+FONT_SUFFIXES = (".ttf", ".woff2")
+BASE_CHARACTERS = string.ascii_letters + string.digits + string.punctuation + " "
+"""
+Characters always kept when subsetting the fonts, as the theme also renders headings that are not in the doctrees.
+"""
+HASHED_ASSET_PATTERN = re.compile(r"[^.]+\.[0-9a-f]{12}\.[^.]+")
+
+
+def hashed_asset_name(name: str, content: bytes) -> str:
+    """
+    Insert the content hash of an asset into its filename, e.g. ``autoflex.css`` into ``autoflex.3f9a1c2b7d4e.css``.
+    """
+    path = pathlib.PurePath(name)
+    content_hash = hashlib.sha256(content).hexdigest()[:12]
+    return f"{path.stem}.{content_hash}{path.suffix}"
+
+
+def subset_font(content: bytes, suffix: str, characters: str) -> bytes:
+    """
+    Subset a font down to the glyphs of the given characters, keeping its format.
+    """
+    from fontTools import subset
+
+    options = subset.Options()
+    options.flavor = "woff2" if suffix == ".woff2" else None
+    font = subset.load_font(io.BytesIO(content), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=characters)
+    subsetter.subset(font)
+
+    output = io.BytesIO()
+    subset.save_font(font, output, options)
+    return output.getvalue()
+
+
+def cached_subset_font(content: bytes, suffix: str, characters: str, cache_dir: pathlib.Path | None) -> bytes:
+    """
+    Subset a font, reusing the subset from a previous build with the same font and characters if it is cached.
+    """
+    if cache_dir is None:
+        return subset_font(content, suffix, characters)
+
+    cache_key = hashlib.sha256(content + characters.encode()).hexdigest()
+    cache_path = cache_dir / f"{cache_key}{suffix}"
+    if cache_path.exists():
+        return cache_path.read_bytes()
+
+    subset_content = subset_font(content, suffix, characters)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(subset_content)
+    return subset_content
+
+
+def build_autoflex_static_assets(
+    characters: str | None = None,
+    cache_dir: pathlib.Path | None = None,
+) -> tuple[str, str, dict[str, bytes]]:
+    """
+    Build the hashed static assets of the ``autoflex`` styles.
+
+    Args:
+        characters: The characters to subset the fonts to. The fonts are not subset if ``None``.
+        cache_dir: The directory in which the subset fonts are cached between builds.
+
+    Returns:
+        tuple[str, str, dict[str, bytes]]: The hashed stylesheet and script paths, and the content of every asset
+        keyed by its hashed path within ``_static``.
+    """
+    assets = {}
+    font_names = {}
+    for path in sorted(STYLES_DIRECTORY.iterdir()):
+        if path.suffix not in FONT_SUFFIXES:
+            continue
+
+        content = path.read_bytes()
+        if characters is not None:
+            try:
+                content = cached_subset_font(content, path.suffix, characters, cache_dir)
+            except Exception as e:
+                logger.warning(f"Could not subset the autoflex font {path.name}, using the full font: {e}")
+
+        font_names[path.name] = hashed_asset_name(path.name, content)
+        assets[f"css/{font_names[path.name]}"] = content
+
+    # Point the stylesheet at the hashed fonts
+    stylesheet = (STYLES_DIRECTORY / STYLESHEET_NAME).read_text()
+    stylesheet = re.sub(
+        r"url\('([^']+)'\)",
+        lambda match: f"url('{font_names.get(match.group(1), match.group(1))}')",
+        stylesheet,
+    )
+    stylesheet_content = stylesheet.encode()
+    stylesheet_path = f"css/{hashed_asset_name(STYLESHEET_NAME, stylesheet_content)}"
+    assets[stylesheet_path] = stylesheet_content
+
+    script_content = (SCRIPTS_DIRECTORY / SCRIPT_NAME).read_bytes()
+    script_path = f"js/{hashed_asset_name(SCRIPT_NAME, script_content)}"
+    assets[script_path] = script_content
+
+    return stylesheet_path, script_path, assets
+
+
+def collect_title_characters(app, doctree):
+    """
+    Record the characters used in the titles of a document, which are rendered with the ``autoflex`` fonts.
+
+    They are recorded even while ``autoflex_subset_fonts`` is disabled, since enabling it does not read the documents
+    again.
+    """
+    characters = set()
+    for title in doctree.findall(nodes.title):
+        characters.update(title.astext())
+
+    if not hasattr(app.env, "autoflex_title_characters"):
+        app.env.autoflex_title_characters = {}
+    app.env.autoflex_title_characters[app.env.docname] = "".join(sorted(characters))
+
+
+def purge_title_characters(app, env, docname):
+    if hasattr(env, "autoflex_title_characters"):
+        env.autoflex_title_characters.pop(docname, None)
+
+
+def merge_title_characters(app, env, docnames, other):
+    if hasattr(other, "autoflex_title_characters"):
+        if not hasattr(env, "autoflex_title_characters"):
+            env.autoflex_title_characters = {}
+        env.autoflex_title_characters.update(other.autoflex_title_characters)
+
+
+def register_autoflex_styles(app, env):
+    """
+    Build the hashed static assets once the documents have been read, write them into the build output before the
+    pages are written, and register the hashed stylesheet and script.
+
+    Returns:
+        list[str]: The documents to write again, as the asset names they link to changed.
+    """
+    characters = None
+    if app.config.autoflex_subset_fonts and not importlib.util.find_spec("fontTools"):
+        logger.warning("`autoflex_subset_fonts` requires `fontTools` to be installed, using the full fonts.")
+    elif app.config.autoflex_subset_fonts:
+        characters = set(BASE_CHARACTERS)
+        for document_characters in getattr(env, "autoflex_title_characters", {}).values():
+            characters.update(document_characters)
+        characters = "".join(sorted(characters))
+
+    stylesheet_path, script_path, assets = build_autoflex_static_assets(
+        characters, pathlib.Path(app.doctreedir) / "autoflex_fonts"
+    )
+    app.add_css_file(stylesheet_path)
+    app.add_js_file(script_path, defer="defer")
+
+    if app.builder.format == "html":
+        write_autoflex_static_assets(pathlib.Path(app.outdir) / "_static", assets)
+
+    # The outdated assets are removed, so every page is written again when the linked asset names change
+    previous_asset_paths = getattr(env, "autoflex_static_asset_paths", None)
+    env.autoflex_static_asset_paths = (stylesheet_path, script_path)
+    if previous_asset_paths is not None and previous_asset_paths != env.autoflex_static_asset_paths:
+        return list(env.found_docs)
+    return []
 
 
-def copy_autoflex_styles_to_static(app, exception):
-    # Define source directory where your styles are located
-    source_dir = pathlib.Path(__file__).parent / "css"
+def write_autoflex_static_assets(build_static_dir: pathlib.Path, assets: dict[str, bytes]):
+    """
+    Write the hashed static assets into the build output ``_static`` directory, and remove the outdated ones.
 
-    # Define destination directory in the build output's _static folder
-    build_static_dir = pathlib.Path(app.outdir) / '_static' / "css"
+    Assets already present are skipped since their filename is their hash.
+    """
+    asset_stems = {pathlib.PurePath(path).name.split(".")[0] for path in assets}
+    asset_directories = {pathlib.PurePath(path).parent for path in assets}
 
-    # Ensure the destination directory exists
-    build_static_dir.mkdir(parents=True, exist_ok=True)
+    # Remove the assets of previous builds whose hash no longer matches
+    for directory in asset_directories:
+        for asset_path in (build_static_dir / directory).glob("*.*.*"):
+            if (
+                asset_path.name.split(".")[0] in asset_stems
+                and HASHED_ASSET_PATTERN.fullmatch(asset_path.name)
+                and f"{directory}/{asset_path.name}" not in assets
+            ):
+                asset_path.unlink()
+                logger.verbose(f"Removed outdated autoflex static asset {asset_path.name}")
 
-    # Copy all files from the source to the destination
-    for item in source_dir.iterdir():
-        if item.is_file():
-            shutil.copy(item, build_static_dir / item.name)
-        elif item.is_dir():
-            # Copy directories recursively
-            shutil.copytree(item, build_static_dir / item.name, dirs_exist_ok=True)
+    for name, content in assets.items():
+        asset_path = build_static_dir / name
+        if asset_path.exists():
+            continue
+        asset_path.parent.mkdir(parents=True, exist_ok=True)
+        asset_path.write_bytes(content)
+        logger.verbose(f"Written autoflex static asset {name}")
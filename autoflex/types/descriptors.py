@@ -2,8 +2,8 @@
 This contains all the relevant types used for the documentation constructors and base definition.
 """
 import pydantic.fields
-from pydantic import Field
-from typing import Union
+from pydantic import ConfigDict, Field
+from typing import Optional, Union
 from autoflex.types.core import AutoflexBaseModel
 
 class Symbolic(AutoflexBaseModel):
@@ -14,6 +14,8 @@ class Symbolic(AutoflexBaseModel):
         label: The label for the symbolic expression (e.g., 'Force').
         math: The mathematical formula or representation (e.g., 'F = ma').
     """
+    model_config = ConfigDict(frozen=True)
+
     label: str = Field(..., description="Label of the symbolic representation")
     math: str = Field(..., description="Mathematical representation or equation")
 
@@ -29,8 +31,10 @@ class Unit(AutoflexBaseModel):
         symbol: The symbol for the unit (e.g., 'm', 's').
         description: An optional description of the unit.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the unit")
     symbol: SymbolicTypes = Field(..., description="Symbol for the unit")
-    description: str = Field(None, description="Optional description of the unit")
+    description: Optional[str] = Field(None, description="Optional description of the unit")
 
 UnitTypes = Union[str, Unit]
@@ -5,7 +5,8 @@ class PhysicalFieldInfo(pd.fields.FieldInfo):
     """
     Each field should correspond to an individual physical property field that can represent it completely within the documentation.
 
-    Note that this compiles into a PhysicalProperty accordingly.
+    Note that this compiles into a PhysicalProperty accordingly. The ``unit`` and ``math`` are stored as declared and
+    are only validated into their ``Unit`` and ``Symbolic`` representations when the documentation is extracted.
     """
 
     unit: UnitTypes = ""
@@ -16,5 +17,15 @@ class PhysicalFieldInfo(pd.fields.FieldInfo):
     """
     """
 
+    def __init__(self, *, unit: UnitTypes = "", math: SymbolicTypes = "", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.unit = unit
+        self.math = math
+
+    def __repr_args__(self):
+        yield from super().__repr_args__()
+        yield "unit", self.unit
+        yield "math", self.math
+
 
 FieldTypes = PhysicalFieldInfo | pd.fields.FieldInfo
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+IMPORT_TIME_LIMIT_US = 50_000
+"""
+Cumulative time ``import autoflex`` is allowed to take, in microseconds, as reported by ``-X importtime``.
+"""
+
+
+def test_autoflex_import_time():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, autoflex; print(sorted({'pydantic', 'sphinx', 'autoflex.extractors'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each line of the report is "import time: self [us] | cumulative | imported package"
+    cumulative_import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, package = line.split("|")
+        if cumulative.strip().isdigit():
+            cumulative_import_times[package.strip()] = int(cumulative)
+
+    print(f"autoflex import time: {cumulative_import_times['autoflex']} us")
+    assert result.stdout.strip() == "[]", f"Heavy modules imported by autoflex: {result.stdout.strip()}"
+    assert cumulative_import_times["autoflex"] < IMPORT_TIME_LIMIT_US
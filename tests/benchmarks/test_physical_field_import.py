@@ -0,0 +1,58 @@
+import importlib
+import sys
+import time
+
+from autoflex.types import PhysicalFieldInfo
+
+CLASS_COUNT = 50
+FIELDS_PER_CLASS = 100
+
+
+def write_field_module(path, module_name: str, field_declaration: str):
+    """Write a module declaring ``CLASS_COUNT * FIELDS_PER_CLASS`` fields with the given declaration."""
+    lines = ["import pydantic as pd", "from autoflex.field import PhysicalField", ""]
+    for class_index in range(CLASS_COUNT):
+        lines.append(f"class Model{class_index}(pd.BaseModel):")
+        for field_index in range(FIELDS_PER_CLASS):
+            lines.append(f"    field_{field_index}: float = {field_declaration}")
+        lines.append("")
+    (path / f"{module_name}.py").write_text("\n".join(lines))
+
+
+def time_import(module_name: str):
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    return module, time.perf_counter() - start
+
+
+def test_physical_field_module_import_time(tmp_path, monkeypatch):
+    write_field_module(
+        tmp_path,
+        "standard_fields",
+        'pd.Field(1.0, description="Length of the structure")',
+    )
+    write_field_module(
+        tmp_path,
+        "physical_fields",
+        'PhysicalField(1.0, unit="um", math="L", description="Length of the structure")',
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        _, standard_import_time = time_import("standard_fields")
+        physical_module, physical_import_time = time_import("physical_fields")
+    finally:
+        sys.modules.pop("standard_fields", None)
+        sys.modules.pop("physical_fields", None)
+
+    print(f"Standard fields import: {standard_import_time:.3f}s")
+    print(f"Physical fields import: {physical_import_time:.3f}s")
+
+    field = physical_module.Model0.model_fields["field_0"]
+    assert isinstance(field, PhysicalFieldInfo)
+    assert field.description == "Length of the structure"
+    assert field.unit == "um"
+    assert field.math == "L"
+
+    # Declaring physical fields should cost about the same as declaring standard pydantic fields.
+    assert physical_import_time < 2 * standard_import_time
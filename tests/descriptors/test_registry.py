@@ -0,0 +1,38 @@
+from autoflex.descriptors import DescriptorRegistry, TableCell
+from autoflex.extractors import physical_field_info_to_physical_property
+from autoflex.types import PhysicalFieldInfo, Symbolic, Unit
+
+
+def test_descriptor_registry_interns_units():
+    registry = DescriptorRegistry()
+
+    unit = registry.unit("um")
+
+    assert isinstance(unit, Unit)
+    assert unit.symbol == "um"
+    assert registry.unit("um") is unit
+    assert registry.unit(Unit(name="um", symbol="um")) is unit
+    assert registry.unit_cell("um") == TableCell("um", math=False)
+
+    symbolic_unit = registry.unit(Unit(name="hertz", symbol=Symbolic(label="Hz", math=r"\mathrm{Hz}")))
+    assert registry.unit_cell(symbolic_unit) == TableCell(r"\mathrm{Hz}", math=True)
+
+
+def test_descriptor_registry_interns_symbolics():
+    registry = DescriptorRegistry()
+
+    symbolic = registry.symbolic("F = ma")
+
+    assert isinstance(symbolic, Symbolic)
+    assert registry.symbolic("F = ma") is symbolic
+    assert registry.symbolic(Symbolic(label="F = ma", math="F = ma")) is symbolic
+    assert registry.symbolic_cell("F = ma") == TableCell("F = ma", math=True)
+    assert registry.symbolic_cell("") == TableCell("", math=False)
+
+
+def test_physical_properties_share_descriptors():
+    first_property = physical_field_info_to_physical_property(PhysicalFieldInfo(unit="rad/s", math=r"\omega"), "a")
+    second_property = physical_field_info_to_physical_property(PhysicalFieldInfo(unit="rad/s", math=r"\omega"), "b")
+
+    assert first_property.unit is second_property.unit
+    assert first_property.math is second_property.math
@@ -0,0 +1,47 @@
+import pydantic as pd
+from pydantic import AliasChoices, AliasPath
+from sphinx.application import Sphinx
+
+from autoflex.directives.autoflex import schema_property_key
+from autoflex.store import PropertyStore
+
+
+class Opaque:
+    pass
+
+
+class NoSchemaModel(pd.BaseModel):
+    model_config = pd.ConfigDict(arbitrary_types_allowed=True)
+
+    opaque: Opaque = pd.Field(default_factory=Opaque, description="A field without a JSON schema")
+
+
+def test_schema_property_key_matches_json_schema():
+    class AliasedModel(pd.BaseModel):
+        plain: int = 1
+        aliased: int = pd.Field(1, alias="aliased_key")
+        validation_aliased: int = pd.Field(1, validation_alias="validation_key")
+        path_aliased: int = pd.Field(1, validation_alias=AliasPath("path_key", 0))
+        choice_aliased: int = pd.Field(1, validation_alias=AliasChoices(AliasPath("nested", 0), "choice_key"))
+
+    property_keys = [schema_property_key(field, name) for name, field in AliasedModel.model_fields.items()]
+
+    assert property_keys == list(AliasedModel.model_json_schema(by_alias=True)["properties"])
+
+
+def test_autoflex_directive_reports_models_without_schema(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "conf.py").write_text(
+        'extensions = ["autoflex"]\nautoflex_property_store = "autoflex_properties.sqlite"\n'
+    )
+    (source_dir / "index.rst").write_text(f"Index\n=====\n\n.. autoflex:: {__name__}.NoSchemaModel\n")
+
+    app = Sphinx(source_dir, source_dir, tmp_path / "out", tmp_path / "doctrees", "html", status=None, warning=None)
+    app.build()
+
+    # The schema error is reported by the directive instead of aborting the build, and nothing is stored
+    assert (tmp_path / "out" / "index.html").exists()
+    store = PropertyStore(source_dir / "autoflex_properties.sqlite")
+    assert store.find_properties() == []
+    store.close()
@@ -1,8 +1,11 @@
+import warnings
+
 import pydantic as pd
-from pydantic import Field
+import pytest
+from pydantic import AliasPath, Field
 import autoflex
 from autoflex.types import Property, PhysicalProperty, PhysicalFieldInfo, Symbolic
-from autoflex.extractors import field_info_to_property, physical_field_info_to_physical_property, auto_field_to_property_type, extract_property_list_from_model
+from autoflex.extractors import field_info_to_property, physical_field_info_to_physical_property, auto_field_to_property_type, extract_property_list_from_model, get_field_names_by_defining_class
 from autoflex.field import PhysicalField
 
 def test_get_field_infos():
@@ -19,6 +22,20 @@ def test_get_field_infos():
     assert len(basic_mixed_class_fields) == 4, f"Expected 4 fields, found {len(basic_mixed_class_fields)}"
 
 
+def test_get_field_names_by_defining_class():
+    import demo
+
+    class OverridingClass(demo.BasicMixedAnnotatedClass):
+        my_parameter_2: str = "overridden"
+        my_parameter_5: int = 5
+
+    field_names_by_class = get_field_names_by_defining_class(OverridingClass)
+
+    assert list(field_names_by_class.keys()) == [OverridingClass, demo.BasicMixedAnnotatedClass, demo.BasicClass]
+    assert field_names_by_class[OverridingClass] == ["my_parameter_2", "my_parameter_5"]
+    assert field_names_by_class[demo.BasicMixedAnnotatedClass] == ["my_parameter_4"]
+    assert field_names_by_class[demo.BasicClass] == ["my_parameter_1", "my_parameter_3"]
+
 
 
 def test_automatic_field_to_property_extractor():
@@ -161,6 +178,7 @@ def test_extract_property_list_from_model():
     assert mass_prop.name == "mass"
     assert mass_prop.description == "Mass of the object"
     assert mass_prop.default == "5.0"
+    assert mass_prop.types == "float"
 
     velocity_prop = properties[1]
     assert isinstance(velocity_prop, Property)
@@ -172,10 +190,11 @@ def test_extract_property_list_from_model():
     print(force_prop)
     assert isinstance(force_prop, PhysicalProperty)
     assert force_prop.name == "force"
-    # assert force_prop.description == "Force applied"
+    assert force_prop.description == "Force applied"
     assert force_prop.default == "20.0"
-    # assert force_prop.unit == "N"
-    # assert force_prop.math == "F = ma"
+    assert force_prop.types == "float"
+    assert force_prop.unit.symbol == "N"
+    assert force_prop.math.math == "F = ma"
 
     acceleration_prop = properties[3]
     assert isinstance(acceleration_prop, Property)
@@ -254,3 +273,64 @@ def test_automatic_field_to_property_extractor():
     # assert property_physical_extra.math == "d = vt"
 
 
+
+def test_physical_field_keeps_field_kwargs():
+    field = PhysicalField(
+        [1.0],
+        unit="um",
+        math="L",
+        description="Lengths of the object",
+        json_schema_extra={"group": "geometry"},
+        min_length=1,
+    )
+
+    assert field.description == "Lengths of the object"
+    assert field.json_schema_extra == {"group": "geometry"}
+    assert [constraint.min_length for constraint in field.metadata] == [1]
+
+    # Deprecated and extra keyword arguments are handled as in pydantic's Field
+    with pytest.warns(DeprecationWarning):
+        deprecated_field = PhysicalField(1.0, unit="um", math="L", foo=1, min_items=2)
+    standard_field = pd.Field(1.0, foo=1, min_items=2)
+    assert deprecated_field.json_schema_extra == standard_field.json_schema_extra == {"foo": 1}
+    assert deprecated_field.metadata == standard_field.metadata
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"alias": "length_alias"},
+        {"alias": "length_alias", "serialization_alias": "serialized", "validation_alias": "validated"},
+        {"alias": "length_alias", "validation_alias": AliasPath("lengths", 0)},
+        {"allow_mutation": False},
+        {"allow_mutation": True},
+        {"min_items": 1, "max_items": 3},
+        {"foo": 1},
+        {"include": {"x"}},
+        {"include": {"x"}, "foo": 1},
+    ],
+)
+def test_physical_field_matches_pydantic_field(kwargs):
+    with warnings.catch_warnings(record=True) as physical_warnings:
+        warnings.simplefilter("always")
+        physical_field = PhysicalField(1.0, unit="um", math="L", **kwargs)
+    with warnings.catch_warnings(record=True) as standard_warnings:
+        warnings.simplefilter("always")
+        standard_field = pd.Field(1.0, **kwargs)
+
+    # Every FieldInfo attribute and warning matches pydantic's Field, so a change in pydantic is caught here
+    for attribute in pd.fields.FieldInfo.__slots__:
+        assert getattr(physical_field, attribute, None) == getattr(standard_field, attribute, None), attribute
+    assert [(warning.category, str(warning.message)) for warning in physical_warnings] == [
+        (warning.category, str(warning.message)) for warning in standard_warnings
+    ]
+
+
+@pytest.mark.parametrize("kwargs", [{"const": 1}, {"unique_items": True}, {"regex": "a"}, {"validation_alias": 1}])
+def test_physical_field_rejects_kwargs_like_pydantic_field(kwargs):
+    with pytest.raises(Exception) as standard_error:
+        pd.Field(1.0, **kwargs)
+    with pytest.raises(standard_error.type) as physical_error:
+        PhysicalField(1.0, unit="um", math="L", **kwargs)
+
+    assert str(physical_error.value) == str(standard_error.value)
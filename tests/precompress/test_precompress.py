@@ -0,0 +1,88 @@
+import gzip
+from types import SimpleNamespace
+
+from autoflex.precompress import PRECOMPRESS_MANIFEST_NAME, PRECOMPRESS_POOL_MIN_FILES, precompress_build_output
+
+
+def make_app(tmp_path, precompress=True, parallel=1, doctreedir=None):
+    return SimpleNamespace(
+        outdir=str(tmp_path / "html"),
+        doctreedir=str(doctreedir or tmp_path / "doctrees"),
+        parallel=parallel,
+        config=SimpleNamespace(autoflex_precompress=precompress),
+        builder=SimpleNamespace(format="html"),
+    )
+
+
+def test_precompress_build_output(tmp_path):
+    outdir = tmp_path / "html"
+    (outdir / "api").mkdir(parents=True)
+    (outdir / "index.html").write_text("<html>index</html>")
+    (outdir / "api" / "schema.json").write_text('{"a": 1}')
+    (outdir / "autoflex.css").write_text("body {}")
+
+    precompress_build_output(make_app(tmp_path), None)
+
+    assert gzip.decompress((outdir / "index.html.gz").read_bytes()) == b"<html>index</html>"
+    assert gzip.decompress((outdir / "api" / "schema.json.gz").read_bytes()) == b'{"a": 1}'
+    assert not (outdir / "autoflex.css.gz").exists()
+
+    # The manifest is kept out of the deployed build output
+    assert (tmp_path / "doctrees" / PRECOMPRESS_MANIFEST_NAME).exists()
+    assert not list(outdir.glob("*precompress*"))
+
+    # Unchanged files are not compressed again, and removed files lose their compressed copy
+    schema_mtime = (outdir / "api" / "schema.json.gz").stat().st_mtime_ns
+    (outdir / "index.html").unlink()
+    precompress_build_output(make_app(tmp_path), None)
+
+    assert (outdir / "api" / "schema.json.gz").stat().st_mtime_ns == schema_mtime
+    assert not (outdir / "index.html.gz").exists()
+
+
+def test_precompress_build_output_skips_doctrees(tmp_path):
+    outdir = tmp_path / "html"
+    doctreedir = outdir / ".doctrees"
+    doctreedir.mkdir(parents=True)
+    (doctreedir / "environment.json").write_text("{}")
+    (outdir / "_modules").mkdir()
+    (outdir / "_modules" / "page.html").write_text("<html>module</html>")
+    (outdir / "index.html").write_text("<html>index</html>")
+
+    precompress_build_output(make_app(tmp_path, doctreedir=doctreedir), None)
+
+    # Only the pages are compressed, not the doctrees nor the manifest stored with them
+    assert sorted(path.relative_to(outdir).as_posix() for path in outdir.rglob("*.gz")) == [
+        "_modules/page.html.gz",
+        "index.html.gz",
+    ]
+    assert (doctreedir / PRECOMPRESS_MANIFEST_NAME).exists()
+
+    # A rebuild without changes compresses nothing again
+    index_mtime = (outdir / "index.html.gz").stat().st_mtime_ns
+    precompress_build_output(make_app(tmp_path, doctreedir=doctreedir), None)
+    assert (outdir / "index.html.gz").stat().st_mtime_ns == index_mtime
+    assert not list(doctreedir.rglob("*.gz"))
+
+
+def test_precompress_build_output_parallel(tmp_path):
+    outdir = tmp_path / "html"
+    outdir.mkdir()
+    for index in range(PRECOMPRESS_POOL_MIN_FILES):
+        (outdir / f"page_{index}.html").write_text(f"<html>{index}</html>")
+
+    precompress_build_output(make_app(tmp_path, parallel=2), None)
+
+    for index in range(PRECOMPRESS_POOL_MIN_FILES):
+        assert gzip.decompress((outdir / f"page_{index}.html.gz").read_bytes()) == f"<html>{index}</html>".encode()
+
+
+def test_precompress_build_output_disabled(tmp_path):
+    outdir = tmp_path / "html"
+    outdir.mkdir()
+    (outdir / "index.html").write_text("<html>index</html>")
+
+    precompress_build_output(make_app(tmp_path, precompress=False), None)
+    precompress_build_output(make_app(tmp_path), RuntimeError())
+
+    assert not (outdir / "index.html.gz").exists()
@@ -0,0 +1,56 @@
+import pydantic as pd
+
+from autoflex.field import PhysicalField
+from autoflex.store import PropertyStore, class_path, get_or_extract_properties, model_content_hash
+from autoflex.types import PhysicalProperty, Property
+
+
+class StoredModel(pd.BaseModel):
+    mass: float = pd.Field(5.0, description="Mass of the object")
+    length: float = PhysicalField(1.0, unit="um", math="L", description="Length of the object")
+    width: float = PhysicalField(2.0, unit="um", math="W", description="Width of the object")
+
+
+def test_property_store_round_trip(tmp_path):
+    store = PropertyStore(tmp_path / "properties.sqlite")
+
+    properties = get_or_extract_properties(store, StoredModel)
+    stored_properties = store.get_properties(class_path(StoredModel), model_content_hash(StoredModel))
+
+    assert stored_properties == properties
+    assert isinstance(stored_properties[0], Property)
+    assert isinstance(stored_properties[1], PhysicalProperty)
+    assert stored_properties[1].unit is properties[1].unit
+
+    # A changed content hash invalidates the stored properties
+    assert store.get_properties(class_path(StoredModel), "outdated") is None
+    store.close()
+
+
+def test_property_store_queries(tmp_path):
+    store = PropertyStore(tmp_path / "properties.sqlite")
+    get_or_extract_properties(store, StoredModel)
+
+    # The store survives reopening, e.g. in a later build or from a script
+    store.close()
+    store = PropertyStore(tmp_path / "properties.sqlite")
+
+    assert [item.name for _, item in store.find_properties(unit="um")] == ["length", "width"]
+    assert [item.name for _, item in store.find_properties(name="mass")] == ["mass"]
+    assert {path for path, _ in store.find_properties(model_path=class_path(StoredModel))} == {class_path(StoredModel)}
+    assert store.find_properties(model_path="missing.Model") == []
+    store.close()
+
+
+def test_model_content_hash_follows_resolved_fields():
+    def define_model(default_mass: float, unit: str) -> type:
+        class ExternalModel(pd.BaseModel):
+            mass: float = pd.Field(default_mass, description="Mass of the object")
+            length: float = PhysicalField(1.0, unit=unit, math="L", description="Length of the object")
+
+        return ExternalModel
+
+    # The default and unit come from outside the class source, e.g. from constants of another module
+    assert model_content_hash(define_model(5.0, "um")) == model_content_hash(define_model(5.0, "um"))
+    assert model_content_hash(define_model(5.0, "um")) != model_content_hash(define_model(6.0, "um"))
+    assert model_content_hash(define_model(5.0, "um")) != model_content_hash(define_model(5.0, "nm"))
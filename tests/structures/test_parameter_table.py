@@ -0,0 +1,49 @@
+import json
+
+import pydantic as pd
+from docutils import nodes
+
+from autoflex.constructors.parameter_table import (
+    PARAMETER_TABLE_COLUMNS,
+    extract_class_to_parameter_table,
+    parameter_table_to_nodes,
+    parameter_table_to_payload,
+)
+from autoflex.field import PhysicalField
+
+
+class TableModel(pd.BaseModel):
+    mass: float = pd.Field(5.0, description="Mass of the object")
+    length: float = PhysicalField(1.0, unit="um", math="L", description="Length </script> of the object")
+    width: float = pd.Field(2.0, description="Width <!-- <script> & more -->")
+
+
+def test_parameter_table_to_payload():
+    table = extract_class_to_parameter_table(TableModel)
+
+    payload = parameter_table_to_payload(table)
+
+    # Neither a closing tag nor a comment can end or escape the embedding script element
+    assert not {"<", ">", "&"} & set(payload)
+    payload_dict = json.loads(payload)
+    assert payload_dict["columns"] == PARAMETER_TABLE_COLUMNS
+    assert payload_dict["rows"][0] == ["mass", "float", "Mass of the object", "5.0", "", ""]
+    # Only the cells typeset as math are wrapped, so the plain unit symbol stays text
+    assert payload_dict["rows"][1] == ["length", "float", "Length </script> of the object", "1.0", "um", ["L"]]
+    assert payload_dict["rows"][2] == ["width", "float", "Width <!-- <script> & more -->", "2.0", "", ""]
+
+
+def test_parameter_table_to_nodes():
+    table = extract_class_to_parameter_table(TableModel)
+
+    (static_table,) = parameter_table_to_nodes(table)
+    (virtual_table,) = parameter_table_to_nodes(table, virtual=True)
+
+    assert isinstance(static_table, nodes.table)
+    assert len(list(static_table.findall(nodes.row))) == 4
+    assert len(list(static_table.findall(nodes.math))) == 1
+
+    # The virtual table embeds the payload next to the static fallback table
+    assert "autoflex-virtual-table" in virtual_table["classes"]
+    assert isinstance(virtual_table[0], nodes.raw)
+    assert isinstance(virtual_table[1], nodes.table)
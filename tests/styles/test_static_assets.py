@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from docutils import nodes
+
+from autoflex.styles.setup import (
+    build_autoflex_static_assets,
+    collect_title_characters,
+    hashed_asset_name,
+    write_autoflex_static_assets,
+)
+
+
+def test_hashed_asset_name():
+    assert hashed_asset_name("autoflex.css", b"a") == hashed_asset_name("autoflex.css", b"a")
+    assert hashed_asset_name("autoflex.css", b"a") != hashed_asset_name("autoflex.css", b"b")
+    assert hashed_asset_name("autoflex.css", b"a").startswith("autoflex.")
+    assert hashed_asset_name("autoflex.css", b"a").endswith(".css")
+
+
+def test_build_autoflex_static_assets():
+    stylesheet_path, script_path, assets = build_autoflex_static_assets()
+
+    assert stylesheet_path in assets
+    assert script_path in assets
+    assert len(assets) == 4
+
+    # The stylesheet should reference the hashed fonts
+    stylesheet = assets[stylesheet_path].decode()
+    for path in assets:
+        if path not in (stylesheet_path, script_path):
+            assert f"url('{path.removeprefix('css/')}')" in stylesheet
+
+
+def test_write_autoflex_static_assets(tmp_path):
+    _, _, assets = build_autoflex_static_assets()
+    outdated_stylesheet = tmp_path / "css" / hashed_asset_name("autoflex.css", b"outdated")
+    unrelated_file = tmp_path / "css" / "custom.0123456789ab.css"
+    outdated_stylesheet.parent.mkdir(parents=True)
+    outdated_stylesheet.write_text("outdated")
+    unrelated_file.write_text("custom")
+
+    write_autoflex_static_assets(tmp_path, assets)
+
+    for path, content in assets.items():
+        assert (tmp_path / path).read_bytes() == content
+    assert not outdated_stylesheet.exists()
+    assert unrelated_file.exists()
+
+
+def test_collect_title_characters_without_subsetting():
+    env = SimpleNamespace(docname="index")
+    app = SimpleNamespace(env=env, config=SimpleNamespace(autoflex_subset_fonts=False))
+    doctree = nodes.document(None, None)
+    doctree += nodes.section("", nodes.title(text="Indexλ"))
+
+    collect_title_characters(app, doctree)
+
+    # The characters are available once the subsetting is enabled on an existing build
+    assert "λ" in env.autoflex_title_characters["index"]